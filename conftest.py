@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared pytest configuration for backup tests.
+
+Every test writes only to its own tmp_path (or its own backup_path
+directory), so the suite can run in parallel with pytest-xdist:
+
+    pip install pytest-xdist
+    pytest -n auto --dist=loadgroup test_backup_folder.py \
+        test_backup_folder_integration.py test_restore_folder.py
+
+Tests that patch process-wide state are marked with
+``xdist_group`` and kept on one worker.
+
+Source trees built by session-scoped fixtures are shared between
+tests and must not be modified; source_tree gives each test its own
+hardlinked copy instead.
+
+Archiving tests that use fast_compress run at DEFLATE level 1; set
+BACKUP_TEST_FULL_COMPRESSION=1 to keep the default level.
+"""
+
+import functools
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+# Add project root to sys.path once for all test modules
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Constants following PEP 8
+SHM_DIR = '/dev/shm'  # tmpfs on Linux: archives never touch the disk
+WARNING_FILTERS = (
+    'ignore::DeprecationWarning:pyzipper.*',
+)
+TEST_STRUCTURE_FILES = {
+    "file1.txt": b"Content of file 1",
+    "subdir/file2.txt": b"Content of file 2",
+    "subdir/file3.txt": b"Content of file 3",
+}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register suite-wide warning filters and the xdist_group marker.
+
+    Filters added here are read once per (worker) process instead of
+    being attached to individual tests.
+
+    Args:
+        config: pytest configuration.
+    """
+    for warning_filter in WARNING_FILTERS:
+        config.addinivalue_line('filterwarnings', warning_filter)
+
+    if not config.pluginmanager.hasplugin('xdist'):
+        config.addinivalue_line(
+            'markers',
+            'xdist_group(name): run tests of a group on one xdist worker'
+        )
+
+
+@pytest.fixture(scope="session")
+def test_structure(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create test file structure once per session.
+
+    Args:
+        tmp_path_factory: pytest session temporary directory factory.
+
+    Returns:
+        Path: Read-only source directory with three files.
+    """
+    test_dir = tmp_path_factory.mktemp("test_source")
+    (test_dir / "subdir").mkdir()
+
+    for name, content in TEST_STRUCTURE_FILES.items():
+        (test_dir / name).write_bytes(content)
+
+    return test_dir
+
+
+@pytest.fixture(scope="session")
+def source_master(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create master flat tree of small files once per session.
+
+    Args:
+        tmp_path_factory: pytest session temporary directory factory.
+
+    Returns:
+        Path: Directory with file0.txt .. file4.txt.
+    """
+    master_dir = tmp_path_factory.mktemp("source_master")
+    for i in range(5):
+        (master_dir / f"file{i}.txt").write_bytes(b"content %d" % i)
+    return master_dir
+
+
+@pytest.fixture
+def source_tree(source_master: Path, tmp_path: Path) -> Path:
+    """Hardlink copy of the master tree in the test's tmp_path.
+
+    Args:
+        source_master: Session master tree.
+        tmp_path: pytest per-test temporary directory.
+
+    Returns:
+        Path: tmp_path / "source" sharing inodes with the master tree.
+    """
+    source_dir = tmp_path / "source"
+    shutil.copytree(source_master, source_dir, copy_function=os.link)
+    return source_dir
+
+
+@pytest.fixture
+def fast_compress(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make BackupCreator default to FAST_COMPRESSION_LEVEL.
+
+    Tests that pass compress_level explicitly are unaffected. Disabled
+    when BACKUP_TEST_FULL_COMPRESSION is set.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+    """
+    if os.environ.get('BACKUP_TEST_FULL_COMPRESSION'):
+        return
+
+    from utils.backup_folder import BackupCreator, FAST_COMPRESSION_LEVEL
+
+    original_init = BackupCreator.__init__
+
+    @functools.wraps(original_init)
+    def fast_init(self, *args, **kwargs):
+        kwargs.setdefault('compress_level', FAST_COMPRESSION_LEVEL)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(BackupCreator, '__init__', fast_init)
+
+
+@pytest.fixture
+def backup_path(tmp_path: Path) -> Iterator[Path]:
+    """Path to archive for tests, in RAM when /dev/shm is writable.
+
+    Args:
+        tmp_path: pytest per-test temporary directory (fallback).
+
+    Yields:
+        Path: Not yet existing backup_test.zip in a private directory.
+    """
+    if not (os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK)):
+        yield tmp_path / "backup_test.zip"
+        return
+
+    archive_dir = tempfile.mkdtemp(prefix='backup_test_', dir=SHM_DIR)
+    try:
+        yield Path(archive_dir) / "backup_test.zip"
+    finally:
+        shutil.rmtree(archive_dir, ignore_errors=True)
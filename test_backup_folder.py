@@ -12,31 +12,84 @@ Tests individual components:
 - BackupCreator
 """
 
+import contextlib
+import importlib.util
+import io
+import os
 import sys
 import tempfile
+import types
 import zipfile
+import zlib
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 from utils.backup_folder import (
+    DEFAULT_COMPRESSION_LEVEL,
+    FAST_COMPRESSION_LEVEL,
     ArchiveStats,
     BackupCreator,
     FileProcessor,
     ZipArchiveManager,
+    compress_batch,
+    compress_file,
+    deflate_data,
     format_backup_name,
     format_size,
     get_password,
+    has_incompressible_suffix,
+    is_incompressible_data,
     print_archive_info,
     print_progress,
 )
 
+_HAS_PYZIPPER = importlib.util.find_spec("pyzipper") is not None
+_HAS_ISAL = importlib.util.find_spec("isal") is not None
+
+
+def _interrupt_scandir_after_first(creator: BackupCreator):
+    """Patch os.scandir to raise KeyboardInterrupt after first entry."""
+    with os.scandir(creator.source_dir) as entries:
+        first_entry = next(entries)
+
+    def interrupted_entries():
+        yield first_entry
+        raise KeyboardInterrupt("User interruption")
+
+    @contextlib.contextmanager
+    def mock_scandir(path):
+        yield interrupted_entries()
+
+    return patch.object(os, 'scandir', mock_scandir)
+
+
+def _interrupt_scandir(creator: BackupCreator):
+    """Patch os.scandir to raise KeyboardInterrupt immediately."""
+    return patch.object(
+        os,
+        'scandir',
+        side_effect=KeyboardInterrupt("Interruption")
+    )
+
+
+def _interrupt_add_file_after(calls: int):
+    """Build patch raising KeyboardInterrupt after `calls` added files."""
+    def interrupt(creator: BackupCreator):
+        original_add_file = creator._add_file_to_archive
+        call_count = [0]
+
+        def mock_add_file(*args, **kwargs):
+            call_count[0] += 1
+            if call_count[0] <= calls:
+                return original_add_file(*args, **kwargs)
+            raise KeyboardInterrupt("User interruption")
+
+        return patch.object(creator, '_add_file_to_archive', mock_add_file)
+
+    return interrupt
+
 
 class TestFormatBackupName:
     """Tests for format_backup_name function."""
@@ -69,35 +122,18 @@ class TestFormatBackupName:
 class TestFormatSize:
     """Tests for format_size function."""
 
-    def test_format_size_bytes(self) -> None:
-        """Test: formatting bytes."""
-        assert format_size(0) == "0.00 B"
-        assert format_size(512) == "512.00 B"
-        assert format_size(1023) == "1023.00 B"
-
-    def test_format_size_kilobytes(self) -> None:
-        """Test: formatting kilobytes."""
-        result = format_size(1024)
-        assert "KB" in result
-        assert float(result.split()[0]) > 0
-
-    def test_format_size_megabytes(self) -> None:
-        """Test: formatting megabytes."""
-        result = format_size(1024 * 1024)
-        assert "MB" in result
-        assert float(result.split()[0]) > 0
-
-    def test_format_size_gigabytes(self) -> None:
-        """Test: formatting gigabytes."""
-        result = format_size(1024 * 1024 * 1024)
-        assert "GB" in result
-        assert float(result.split()[0]) > 0
-
-    def test_format_size_terabytes(self) -> None:
-        """Test: formatting terabytes."""
-        result = format_size(1024 * 1024 * 1024 * 1024)
-        assert "TB" in result
-        assert float(result.split()[0]) > 0
+    @pytest.mark.parametrize("size_bytes, expected", [
+        (0, "0.00 B"),
+        (512, "512.00 B"),
+        (1023, "1023.00 B"),
+        (1024, "1.00 KB"),
+        (1024 ** 2, "1.00 MB"),
+        (1024 ** 3, "1.00 GB"),
+        (1024 ** 4, "1.00 TB"),
+    ])
+    def test_format_size(self, size_bytes: int, expected: str) -> None:
+        """Test: formatting size with matching unit."""
+        assert format_size(size_bytes) == expected
 
 
 class TestArchiveStats:
@@ -113,39 +149,40 @@ class TestArchiveStats:
         assert stats.archive_size == 0
         assert stats.skipped_files == 0
 
-    def test_compression_ratio_zero_size(self) -> None:
-        """Test: compression ratio with zero size."""
-        stats = ArchiveStats()
-        assert stats.compression_ratio == 0.0
-
-    def test_compression_ratio_calculation(self) -> None:
+    @pytest.mark.parametrize("total_size, archive_size, expected", [
+        (0, 0, 0.0),
+        (1000, 500, 50.0),
+    ])
+    def test_compression_ratio(
+        self,
+        total_size: int,
+        archive_size: int,
+        expected: float
+    ) -> None:
         """Test: compression ratio calculation."""
         stats = ArchiveStats(
-            total_size=1000,
-            archive_size=500
+            total_size=total_size,
+            archive_size=archive_size
         )
-        assert stats.compression_ratio == 50.0
-
-    def test_progress_percent_zero_size(self) -> None:
-        """Test: progress with zero size."""
-        stats = ArchiveStats()
-        assert stats.progress_percent == 0.0
-
-    def test_progress_percent_calculation(self) -> None:
+        assert stats.compression_ratio == expected
+
+    @pytest.mark.parametrize("total_size, processed_size, expected", [
+        (0, 0, 0.0),
+        (1000, 500, 50.0),
+        (1000, 1000, 100.0),
+    ])
+    def test_progress_percent(
+        self,
+        total_size: int,
+        processed_size: int,
+        expected: float
+    ) -> None:
         """Test: progress calculation."""
         stats = ArchiveStats(
-            total_size=1000,
-            processed_size=500
-        )
-        assert stats.progress_percent == 50.0
-
-    def test_progress_percent_100_percent(self) -> None:
-        """Test: 100% progress."""
-        stats = ArchiveStats(
-            total_size=1000,
-            processed_size=1000
+            total_size=total_size,
+            processed_size=processed_size
         )
-        assert stats.progress_percent == 100.0
+        assert stats.progress_percent == expected
 
 
 class TestFileProcessor:
@@ -172,28 +209,72 @@ class TestFileProcessor:
 
         assert result == test_content
 
-    def test_read_file_chunked_small_file(self, tmp_path: Path) -> None:
-        """Test: reading small file in chunks."""
+    def test_copy_file_chunked_small_file(self, tmp_path: Path) -> None:
+        """Test: streaming small file in chunks."""
         test_file = tmp_path / "test.txt"
         test_content = b"Hello, World!"
         test_file.write_bytes(test_content)
 
         processor = FileProcessor(chunk_size=5)
-        result = processor.read_file_chunked(test_file)
+        destination = io.BytesIO()
+        with open(test_file, 'rb') as source:
+            processor.copy_file_chunked(source, destination)
 
-        assert result == test_content
+        assert destination.getvalue() == test_content
 
-    def test_read_file_chunked_large_file(self, tmp_path: Path) -> None:
-        """Test: reading large file in chunks."""
+    def test_copy_file_chunked_large_file(self, tmp_path: Path) -> None:
+        """Test: streaming large file in chunks."""
         test_file = tmp_path / "large.txt"
         large_content = b"X" * (10 * 1024)  # 10 KB
         test_file.write_bytes(large_content)
 
         processor = FileProcessor(chunk_size=1024)
-        result = processor.read_file_chunked(test_file)
+        destination = io.BytesIO()
+        with open(test_file, 'rb') as source:
+            processor.copy_file_chunked(source, destination)
+
+        assert destination.getvalue() == large_content
+
+    def test_copy_file_mapped(self, tmp_path: Path) -> None:
+        """Test: streaming memory-mapped file in slices."""
+        test_file = tmp_path / "mapped.bin"
+        content = bytes(range(256)) * 40 + b"tail"
+        test_file.write_bytes(content)
+
+        processor = FileProcessor(chunk_size=1000)
+        destination = io.BytesIO()
+        with open(test_file, 'rb') as source, \
+                patch('utils.backup_folder.MMAP_MIN_SIZE', 1024), \
+                patch.object(processor, 'copy_file_chunked') as chunked:
+            processor.copy_file_mapped(source, destination, len(content))
+
+        chunked.assert_not_called()
+        assert destination.getvalue() == content
+
+    @pytest.mark.parametrize("content,scanned_size", [
+        (b"", 0),
+        (b"short", 5),
+        (b"shrunk after scan", 4096),
+    ], ids=['empty', 'below-min-size', 'size-changed'])
+    def test_copy_file_mapped_falls_back_to_chunked(
+        self,
+        tmp_path: Path,
+        content: bytes,
+        scanned_size: int
+    ) -> None:
+        """Test: empty, small or changed files are not memory-mapped."""
+        test_file = tmp_path / "changed.bin"
+        test_file.write_bytes(content)
 
-        assert result == large_content
-        assert len(result) == len(large_content)
+        processor = FileProcessor(chunk_size=4)
+        destination = io.BytesIO()
+        with open(test_file, 'rb') as source, \
+                patch('utils.backup_folder.MMAP_MIN_SIZE', 8), \
+                patch('utils.backup_folder.mmap.mmap') as mapped:
+            processor.copy_file_mapped(source, destination, scanned_size)
+
+        mapped.assert_not_called()
+        assert destination.getvalue() == content
 
     def test_read_file_direct_nonexistent_file(
         self,
@@ -206,17 +287,6 @@ class TestFileProcessor:
         with pytest.raises(FileNotFoundError):
             processor.read_file_direct(nonexistent)
 
-    def test_read_file_chunked_nonexistent_file(
-        self,
-        tmp_path: Path
-    ) -> None:
-        """Test: reading nonexistent file in chunks."""
-        processor = FileProcessor()
-        nonexistent = tmp_path / "nonexistent.txt"
-
-        with pytest.raises(FileNotFoundError):
-            processor.read_file_chunked(nonexistent)
-
 
 class TestZipArchiveManager:
     """Tests for ZipArchiveManager class."""
@@ -228,18 +298,12 @@ class TestZipArchiveManager:
         assert manager.zip_class is not None
         assert manager.compression_type is not None
 
-    @patch('builtins.__import__')
     def test_zip_archive_manager_with_password_no_pyzipper(
         self,
-        mock_import
+        monkeypatch
     ) -> None:
         """Test: manager with password without pyzipper (fallback)."""
-        def import_side_effect(name, *args, **kwargs):
-            if name == 'pyzipper':
-                raise ImportError("No module named 'pyzipper'")
-            return __import__(name, *args, **kwargs)
-
-        mock_import.side_effect = import_side_effect
+        monkeypatch.setitem(sys.modules, 'pyzipper', None)
 
         manager = ZipArchiveManager(use_password=True)
         assert manager.use_password is False
@@ -252,26 +316,228 @@ class TestZipArchiveManager:
 
         assert 'compression' in kwargs
         assert 'compresslevel' in kwargs
-        assert kwargs['compresslevel'] == 9
+        assert kwargs['compresslevel'] == DEFAULT_COMPRESSION_LEVEL
         assert 'encryption' not in kwargs
 
+    def test_create_archive_kwargs_custom_level(self) -> None:
+        """Test: archive kwargs use configured compression level."""
+        manager = ZipArchiveManager(
+            use_password=False,
+            compress_level=FAST_COMPRESSION_LEVEL
+        )
+        kwargs = manager.create_archive_kwargs()
+
+        assert kwargs['compresslevel'] == FAST_COMPRESSION_LEVEL
+
+    @pytest.mark.skipif(not _HAS_PYZIPPER, reason="pyzipper not installed")
     def test_create_archive_kwargs_with_password(self) -> None:
         """Test: archive kwargs with password."""
-        try:
-            import pyzipper  # type: ignore[import-untyped]
-            manager = ZipArchiveManager(use_password=True)
-            kwargs = manager.create_archive_kwargs()
-
-            assert 'compression' in kwargs
-            assert 'compresslevel' in kwargs
-            assert 'encryption' in kwargs
-        except ImportError:
-            pytest.skip("pyzipper not installed")
-
-    def test_create_archive_context_manager(self, tmp_path: Path) -> None:
-        """Test: creating archive via context manager."""
+        manager = ZipArchiveManager(use_password=True)
+        kwargs = manager.create_archive_kwargs()
+
+        assert 'compression' in kwargs
+        assert 'compresslevel' in kwargs
+        assert 'encryption' in kwargs
+
+    def test_zip_archive_manager_without_isal(self, monkeypatch) -> None:
+        """Test: stdlib zlib is used when isal is not installed."""
+        monkeypatch.setitem(sys.modules, 'isal', None)
+
+        manager = ZipArchiveManager(use_password=False)
+        assert manager.deflate_backend is None
+
+    def test_open_entry_roundtrip(self, tmp_path: Path) -> None:
+        """Test: data written via open_entry is readable back."""
         manager = ZipArchiveManager(use_password=False)
         archive_path = tmp_path / "test.zip"
+        data = b"backup data " * 1000
+
+        with manager.create_archive(archive_path) as archive:
+            with manager.open_entry(archive, "data.txt", len(data)) as entry:
+                entry.write(data)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            info = archive.getinfo("data.txt")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert archive.read("data.txt") == data
+
+    def test_open_entry_uses_deflate_backend(self, tmp_path: Path) -> None:
+        """Test: entry compresses with the backend (_compressor)."""
+        compress_calls = []
+
+        class RecordingCompressor:
+            def __init__(self, *args) -> None:
+                self._compressor = zlib.compressobj(*args)
+
+            def compress(self, data: bytes) -> bytes:
+                compress_calls.append(len(data))
+                return self._compressor.compress(data)
+
+            def flush(self, *args) -> bytes:
+                return self._compressor.flush(*args)
+
+        manager = ZipArchiveManager(use_password=False)
+        manager.deflate_backend = types.SimpleNamespace(
+            compressobj=RecordingCompressor
+        )
+        archive_path = tmp_path / "test.zip"
+        data = b"backend data " * 1000
+
+        with manager.create_archive(archive_path) as archive:
+            with manager.open_entry(archive, "data.txt", len(data)) as entry:
+                entry.write(data)
+
+        assert sum(compress_calls) == len(data)
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.read("data.txt") == data
+
+    def test_write_compressed_entry_between_entries(
+        self,
+        tmp_path: Path
+    ) -> None:
+        """Test: appended entries keep archive consistent (start_dir)."""
+        manager = ZipArchiveManager(use_password=False)
+        archive_path = tmp_path / "test.zip"
+        data = b"precompressed " * 100
+
+        def write_stored(archive: zipfile.ZipFile, arcname: str) -> None:
+            manager.write_compressed_entry(
+                archive,
+                arcname,
+                zipfile.ZIP_STORED,
+                zlib.crc32(data),
+                len(data),
+                data
+            )
+
+        with manager.create_archive(archive_path) as archive:
+            write_stored(archive, "first.txt")
+            with manager.open_entry(archive, "second.txt", 6) as entry:
+                entry.write(b"second")
+            write_stored(archive, "third.txt")
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == [
+                "first.txt", "second.txt", "third.txt"
+            ]
+            assert archive.read("second.txt") == b"second"
+
+    def test_write_compressed_entry_checks_name(
+        self,
+        tmp_path: Path
+    ) -> None:
+        """Test: appended entries are checked by ZipFile (_writecheck)."""
+        manager = ZipArchiveManager(use_password=False)
+        data = b"duplicate"
+
+        with manager.create_archive(tmp_path / "test.zip") as archive, \
+                pytest.warns(UserWarning, match="Duplicate name"):
+            for _ in range(2):
+                manager.write_compressed_entry(
+                    archive,
+                    "data.txt",
+                    zipfile.ZIP_STORED,
+                    zlib.crc32(data),
+                    len(data),
+                    data
+                )
+
+    def test_write_compressed_entry(self, tmp_path: Path) -> None:
+        """Test: pre-compressed entry is readable and CRC-checked."""
+        source = tmp_path / "source.txt"
+        data = b"compressed elsewhere " * 500
+        source.write_bytes(data)
+        compress_type, crc, file_size, compressed = compress_file(
+            str(source),
+            6
+        )
+
+        manager = ZipArchiveManager(use_password=False)
+        archive_path = tmp_path / "test.zip"
+        with manager.create_archive(archive_path) as archive:
+            manager.write_compressed_entry(
+                archive,
+                "source.txt",
+                compress_type,
+                crc,
+                file_size,
+                compressed
+            )
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            assert archive.read("source.txt") == data
+            info = archive.getinfo("source.txt")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+
+    def test_compress_file_stores_incompressible(
+        self,
+        tmp_path: Path
+    ) -> None:
+        """Test: already-compressed file is returned as stored."""
+        source = tmp_path / "photo.JPG"
+        data = b"not really a jpeg"
+        source.write_bytes(data)
+
+        compress_type, _, file_size, entry_data = compress_file(
+            str(source),
+            6
+        )
+
+        assert compress_type == zipfile.ZIP_STORED
+        assert file_size == len(data)
+        assert entry_data == data
+
+    def test_compress_batch_skips_unreadable(self, tmp_path: Path) -> None:
+        """Test: unreadable file in batch yields None, others compress."""
+        source = tmp_path / "ok.txt"
+        source.write_bytes(b"batch " * 100)
+
+        results = compress_batch(
+            [str(source), str(tmp_path / "missing.txt")],
+            6
+        )
+
+        assert len(results) == 2
+        assert results[0][2] == 600
+        assert results[1] is None
+
+    def test_deflate_data_raw_stream(self) -> None:
+        """Test: one-shot compression yields raw DEFLATE stream."""
+        data = b"deflate me " * 1000
+
+        compressed = deflate_data(data, 6)
+
+        assert len(compressed) < len(data)
+        assert zlib.decompress(compressed, -15) == data
+
+    @pytest.mark.skipif(not _HAS_ISAL, reason="isal not installed")
+    @pytest.mark.parametrize("compress_level", range(1, 10))
+    @pytest.mark.parametrize("data", [
+        b"Content of file 1",
+        b"hello world " * 50,
+    ], ids=['tiny', 'small'])
+    def test_deflate_data_isal_small_entries(
+        self,
+        compress_level: int,
+        data: bytes
+    ) -> None:
+        """Test: ISA-L output of small entries is not above zlib level 1."""
+        from isal import isal_zlib  # type: ignore[import-not-found]
+
+        compressed = deflate_data(data, compress_level, isal_zlib)
+
+        assert zlib.decompress(compressed, -15) == data
+        assert len(compressed) <= len(zlib.compress(data, 1, -15))
+
+    def test_create_archive_context_manager(
+        self,
+        backup_path: Path
+    ) -> None:
+        """Test: creating archive via context manager."""
+        manager = ZipArchiveManager(use_password=False)
+        archive_path = backup_path
 
         assert archive_path.exists() is False
 
@@ -282,6 +548,26 @@ class TestZipArchiveManager:
         assert archive_path.exists()
 
 
+class TestIncompressibleDetection:
+    """Tests for incompressible file detection."""
+
+    def test_has_incompressible_suffix(self) -> None:
+        """Test: known compressed formats are detected by extension."""
+        assert has_incompressible_suffix("photos/img.jpg") is True
+        assert has_incompressible_suffix("archive.TAR.GZ") is True
+        assert has_incompressible_suffix("notes.txt") is False
+        assert has_incompressible_suffix("Makefile") is False
+
+    def test_is_incompressible_data_random(self) -> None:
+        """Test: random data is detected as incompressible."""
+        assert is_incompressible_data(os.urandom(64 * 1024)) is True
+
+    def test_is_incompressible_data_text(self) -> None:
+        """Test: repetitive data is worth compressing."""
+        assert is_incompressible_data(b"text " * 10000) is False
+        assert is_incompressible_data(b"") is False
+
+
 class TestGetPassword:
     """Tests for get_password function."""
 
@@ -315,9 +601,8 @@ class TestGetPassword:
 class TestPrintProgress:
     """Tests for print_progress function."""
 
-    @patch('builtins.print')
-    def test_print_progress(self, mock_print) -> None:
-        """Test: printing archiving progress."""
+    def test_print_progress(self, capsys) -> None:
+        """Test: printing archiving progress in place."""
         stats = ArchiveStats(
             total_files=100,
             processed_files=50,
@@ -327,19 +612,19 @@ class TestPrintProgress:
 
         print_progress(stats)
 
-        mock_print.assert_called_once()
-        call_args = mock_print.call_args[0][0]
-        assert "Processed: 50/100 files" in call_args
-        assert "50.0%" in call_args
+        output = capsys.readouterr().out
+        assert output.startswith("\r")
+        assert "\n" not in output
+        assert "Processed: 50/100 files" in output
+        assert "50.0%" in output
 
 
 class TestPrintArchiveInfo:
     """Tests for print_archive_info function."""
 
-    @patch('builtins.print')
     def test_print_archive_info_without_password(
         self,
-        mock_print,
+        capsys,
         tmp_path: Path
     ) -> None:
         """Test: printing archive info without password."""
@@ -355,15 +640,15 @@ class TestPrintArchiveInfo:
 
         print_archive_info(stats, backup_path, use_password=False)
 
-        assert mock_print.call_count >= 6
-        calls = [str(call) for call in mock_print.call_args_list]
-        assert any("ARCHIVING COMPLETED" in str(call) for call in calls)
-        assert any("Files processed: 10/10" in str(call) for call in calls)
+        output = capsys.readouterr().out
+        assert "ARCHIVING COMPLETED" in output
+        assert "Files processed: 10/10" in output
+        assert "Files skipped" not in output
+        assert "protected with password" not in output
 
-    @patch('builtins.print')
     def test_print_archive_info_with_password(
         self,
-        mock_print,
+        capsys,
         tmp_path: Path
     ) -> None:
         """Test: printing archive info with password."""
@@ -379,14 +664,12 @@ class TestPrintArchiveInfo:
 
         print_archive_info(stats, backup_path, use_password=True)
 
-        assert mock_print.call_count >= 7
-        calls = [str(call) for call in mock_print.call_args_list]
-        assert any("protected with password" in str(call) for call in calls)
+        output = capsys.readouterr().out
+        assert "protected with password" in output
 
-    @patch('builtins.print')
     def test_print_archive_info_with_skipped_files(
         self,
-        mock_print,
+        capsys,
         tmp_path: Path
     ) -> None:
         """Test: printing archive info with skipped files."""
@@ -403,8 +686,8 @@ class TestPrintArchiveInfo:
 
         print_archive_info(stats, backup_path, use_password=False)
 
-        calls = [str(call) for call in mock_print.call_args_list]
-        assert any("Files skipped: 2" in str(call) for call in calls)
+        output = capsys.readouterr().out
+        assert "Files skipped: 2" in output
 
 
 class TestBackupCreator:
@@ -483,140 +766,227 @@ class TestBackupCreator:
         assert creator.stats.total_files == 2
         assert creator.stats.total_size > 0
 
-    def test_backup_creator_create_archive_simple(
+    def test_backup_creator_calculate_total_size_nested(
         self,
         tmp_path: Path
     ) -> None:
-        """Test: creating simple archive without password."""
+        """Test: scanning nested directories records string paths."""
         source_dir = tmp_path / "source"
-        source_dir.mkdir()
+        nested_dir = source_dir / "a" / "b"
+        nested_dir.mkdir(parents=True)
 
-        test_file = source_dir / "test.txt"
-        test_file.write_text("test content", encoding='utf-8')
+        (source_dir / "top.txt").write_text("top")
+        (nested_dir / "deep.txt").write_text("deep content")
 
         backup_path = tmp_path / "backup.zip"
         creator = BackupCreator(source_dir, backup_path, None, None)
 
-        creator.create_archive()
+        creator.calculate_total_size()
 
-        assert backup_path.exists()
-        assert backup_path.stat().st_size > 0
-        assert creator.stats.processed_files == 1
-        assert creator.stats.archive_size > 0
+        assert creator.stats.total_files == 2
+        assert dict(zip(creator._paths, creator._sizes)) == {
+            str(source_dir / "top.txt"): 3,
+            str(nested_dir / "deep.txt"): 12,
+        }
 
-    def test_backup_creator_calculate_total_size_keyboard_interrupt(
+    def test_backup_creator_calculate_total_size_parallel(
         self,
         tmp_path: Path
     ) -> None:
-        """Test: KeyboardInterrupt handling in calculate_total_size()."""
+        """Test: scanning many top-level directories with threads."""
         source_dir = tmp_path / "source"
-        source_dir.mkdir()
+        expected = {}
 
-        for i in range(5):
-            (source_dir / f"file{i}.txt").write_text(f"content {i}")
+        for i in range(6):
+            nested_dir = source_dir / f"dir{i}" / "nested"
+            nested_dir.mkdir(parents=True)
+            for file_path in (nested_dir.parent / "a.txt", nested_dir / "b"):
+                file_path.write_text("x" * i)
+                expected[str(file_path)] = i
 
         backup_path = tmp_path / "backup.zip"
         creator = BackupCreator(source_dir, backup_path, None, None)
 
-        original_rglob = Path.rglob
-
-        def mock_rglob(self, pattern):
-            """Mock rglob that raises KeyboardInterrupt after first file."""
-            files = list(original_rglob(self, pattern))
-            yield files[0]
-            raise KeyboardInterrupt("User interruption")
+        creator.calculate_total_size()
 
-        with patch.object(Path, 'rglob', mock_rglob):
-            with pytest.raises(KeyboardInterrupt):
-                creator.calculate_total_size()
+        assert dict(zip(creator._paths, creator._sizes)) == expected
+        assert creator.stats.total_files == 12
+        assert creator.stats.total_size == sum(expected.values())
 
-    def test_backup_creator_create_archive_keyboard_interrupt(
+    def test_backup_creator_tar_zst_rejects_password(
         self,
         tmp_path: Path
     ) -> None:
-        """Test: KeyboardInterrupt handling in create_archive()."""
+        """Test: tar.zst format cannot be encrypted."""
+        with pytest.raises(ValueError, match="not supported"):
+            BackupCreator(
+                tmp_path,
+                tmp_path / "backup.tar.zst",
+                password=b"secret",
+                archive_format='tar.zst'
+            )
+
+    def test_backup_creator_unknown_format(self, tmp_path: Path) -> None:
+        """Test: unknown archive format is rejected."""
+        with pytest.raises(ValueError, match="Unsupported archive format"):
+            BackupCreator(tmp_path, tmp_path / "b.rar", archive_format='rar')
+
+    def test_backup_creator_files_by_size(self, tmp_path: Path) -> None:
+        """Test: files are dispatched largest first."""
         source_dir = tmp_path / "source"
         source_dir.mkdir()
+        for name, size in (("small", 1), ("large", 300), ("medium", 20)):
+            (source_dir / name).write_bytes(b"x" * size)
 
-        for i in range(3):
-            (source_dir / f"file{i}.txt").write_text(f"content {i}")
-
-        backup_path = tmp_path / "backup.zip"
-        creator = BackupCreator(source_dir, backup_path, None, None)
+        creator = BackupCreator(source_dir, tmp_path / "backup.zip")
         creator.calculate_total_size()
 
-        original_add_file = creator._add_file_to_archive
-        call_count = [0]
+        assert [size for _, size in creator._files_by_size()] == [300, 20, 1]
 
-        def mock_add_file(*args, **kwargs):
-            """Mock _add_file_to_archive raising KeyboardInterrupt."""
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return original_add_file(*args, **kwargs)
-            raise KeyboardInterrupt("User interruption")
+    def test_backup_creator_make_batches(self, tmp_path: Path) -> None:
+        """Test: batches respect work chunk size and file count."""
+        creator = BackupCreator(
+            tmp_path,
+            tmp_path / "backup.zip",
+            work_chunk_size=100
+        )
+        files = [("big", 150), ("a", 60), ("b", 30), ("c", 20)]
+        files += [(f"tiny{i}", 0) for i in range(70)]
 
-        with patch.object(creator, '_add_file_to_archive', mock_add_file):
-            with pytest.raises(KeyboardInterrupt):
-                creator.create_archive()
+        batches = creator._make_batches(files)
 
-        assert not backup_path.exists()
-        assert creator.stats.processed_files == 1
+        assert batches[0] == ["big"]
+        assert batches[1] == ["a", "b"]
+        assert batches[2][0] == "c"
+        assert all(len(batch) <= 64 for batch in batches)
+        assert sum(len(batch) for batch in batches) == len(files)
 
-    def test_backup_creator_create_archive_keyboard_interrupt_during_scanning(
+    def test_backup_creator_serial_prefetch_keeps_order(
         self,
         tmp_path: Path
     ) -> None:
-        """Test: KeyboardInterrupt during file scanning."""
+        """Test: read-ahead serial path keeps scan order and contents."""
         source_dir = tmp_path / "source"
         source_dir.mkdir()
-
-        (source_dir / "test.txt").write_text("test content")
+        expected = {}
+        for i in range(20):
+            content = b"data" * (i * 5)
+            (source_dir / f"file{i:02}.bin").write_bytes(content)
+            expected[f"file{i:02}.bin"] = content
 
         backup_path = tmp_path / "backup.zip"
-        creator = BackupCreator(source_dir, backup_path, None, None)
-
-        with patch.object(
-            Path,
-            'rglob',
-            side_effect=KeyboardInterrupt("Interruption")
-        ):
-            with pytest.raises(KeyboardInterrupt):
-                creator.create_archive()
+        creator = BackupCreator(
+            source_dir,
+            backup_path,
+            max_workers=1,
+            chunk_size=64
+        )
+        creator.create_archive()
 
-        assert not backup_path.exists()
+        scan_order = [Path(path).name for path in creator._paths]
+        with zipfile.ZipFile(backup_path) as archive:
+            assert archive.namelist() == scan_order
+            for name, content in expected.items():
+                assert archive.read(name) == content
 
-    def test_backup_creator_graceful_shutdown_cleanup(
+    @pytest.mark.usefixtures("fast_compress")
+    def test_backup_creator_create_archive_simple(
         self,
         tmp_path: Path
     ) -> None:
-        """Test: graceful shutdown with resource cleanup."""
+        """Test: creating simple archive without password."""
         source_dir = tmp_path / "source"
         source_dir.mkdir()
 
-        (source_dir / "test.txt").write_text("test content")
+        test_file = source_dir / "test.txt"
+        test_file.write_text("test content", encoding='utf-8')
 
         backup_path = tmp_path / "backup.zip"
         creator = BackupCreator(source_dir, backup_path, None, None)
+
+        creator.create_archive()
+
+        assert backup_path.exists()
+        assert backup_path.stat().st_size > 0
+        assert creator.stats.processed_files == 1
+        assert creator.stats.archive_size > 0
+
+    def test_backup_creator_rescan_no_duplicates(
+        self,
+        source_tree: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: scanning again before archiving does not repeat files."""
+        creator = BackupCreator(source_tree, backup_path, None, None)
+        creator.calculate_total_size()
         creator.calculate_total_size()
 
-        archive = creator.archive_manager.create_archive(backup_path, None)
-        archive.__enter__()
+        assert creator.stats.total_files == 5
+
+        creator.create_archive()
+
+        assert creator.stats.total_files == 5
+        assert creator.stats.processed_files == 5
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            names = archive.namelist()
+        assert sorted(names) == [f"file{i}.txt" for i in range(5)]
+
+    def test_backup_creator_unreadable_file_skipped(
+        self,
+        tmp_path: Path
+    ) -> None:
+        """Test: unreadable file is skipped without leaving an entry."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "locked.txt").write_text("secret")
+
+        backup_path = tmp_path / "backup.zip"
+        creator = BackupCreator(source_dir, backup_path, None, None)
 
-        try:
-            raise KeyboardInterrupt("Interruption")
-        except KeyboardInterrupt:
-            archive.__exit__(None, None, None)
-            assert backup_path.exists()
+        with patch.object(
+            FileProcessor,
+            'read_file_direct',
+            side_effect=PermissionError("Access denied")
+        ):
+            creator.create_archive()
+
+        assert creator.stats.skipped_files == 1
+        assert creator.stats.processed_files == 0
+        with zipfile.ZipFile(backup_path) as archive:
+            assert archive.namelist() == []
+
+    @pytest.mark.xdist_group("monkeypatch_scandir")
+    @pytest.mark.parametrize("method, interrupt, processed", [
+        ('calculate_total_size', _interrupt_scandir_after_first, 0),
+        ('create_archive', _interrupt_scandir, 0),
+        ('create_archive', _interrupt_add_file_after(0), 0),
+        ('create_archive', _interrupt_add_file_after(1), 1),
+    ], ids=['total-size-scan', 'scan', 'first-file', 'second-file'])
+    def test_backup_creator_keyboard_interrupt(
+        self,
+        source_tree: Path,
+        backup_path: Path,
+        method: str,
+        interrupt,
+        processed: int
+    ) -> None:
+        """Test: KeyboardInterrupt propagates and leaves no archive."""
+        # Serial path regardless of host CPUs: the pool bypasses
+        # _add_file_to_archive
+        creator = BackupCreator(
+            source_tree,
+            backup_path,
+            None,
+            None,
+            max_workers=1
+        )
 
-            with patch.object(
-                creator,
-                '_add_file_to_archive',
-                side_effect=KeyboardInterrupt("Interruption")
-            ):
-                with pytest.raises(KeyboardInterrupt):
-                    creator.create_archive()
+        with interrupt(creator):
+            with pytest.raises(KeyboardInterrupt):
+                getattr(creator, method)()
 
-            assert not backup_path.exists()
+        assert not backup_path.exists()
+        assert creator.stats.processed_files == processed
 
 
 if __name__ == "__main__":
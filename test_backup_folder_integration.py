@@ -10,47 +10,56 @@ Tests complete backup creation cycle:
 - Statistics validation
 """
 
+import contextlib
+import errno
+import importlib.util
+import io
+import os
 import sys
+import tarfile
+import types
 import zipfile
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-# Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+from utils.backup_folder import (
+    BackupCreator,
+    FileProcessor,
+    format_backup_name,
+)
 
-from utils.backup_folder import BackupCreator, format_backup_name
+_HAS_PYZIPPER = importlib.util.find_spec("pyzipper") is not None
 
+pytestmark = pytest.mark.usefixtures("fast_compress")
 
-class TestBackupCreatorIntegration:
-    """Integration tests for BackupCreator."""
 
-    @pytest.fixture
-    def test_structure(self, tmp_path: Path) -> Path:
-        """Create test file structure."""
-        test_dir = tmp_path / "test_source"
-        test_dir.mkdir()
+class UnreadableFile(io.FileIO):
+    """File that opens and stats fine but fails every read."""
 
-        file1 = test_dir / "file1.txt"
-        file1.write_text("Content of file 1", encoding='utf-8')
+    def read(self, size: int = -1) -> bytes:
+        raise OSError(errno.EIO, "Input/output error")
 
-        subdir = test_dir / "subdir"
-        subdir.mkdir()
 
-        file2 = subdir / "file2.txt"
-        file2.write_text("Content of file 2", encoding='utf-8')
+@pytest.fixture
+def passthrough_zstandard(monkeypatch) -> None:
+    """Stand-in zstandard module writing the tar stream uncompressed."""
+    class ZstdCompressor:
+        def __init__(self, level: int, threads: int) -> None:
+            self.level = level
 
-        file3 = subdir / "file3.txt"
-        file3.write_text("Content of file 3", encoding='utf-8')
+        def stream_writer(self, raw):
+            return contextlib.nullcontext(raw)
 
-        return test_dir
+    module = types.ModuleType("zstandard")
+    module.ZstdCompressor = ZstdCompressor
+    monkeypatch.setitem(sys.modules, "zstandard", module)
 
-    @pytest.fixture
-    def backup_path(self, tmp_path: Path) -> Path:
-        """Path to archive for tests."""
-        return tmp_path / "backup_test.zip"
+
+class TestBackupCreatorIntegration:
+    """Integration tests for BackupCreator."""
 
     def test_backup_creator_without_password(
         self,
@@ -74,17 +83,13 @@ class TestBackupCreatorIntegration:
         assert creator.stats.archive_size > 0
         assert creator.stats.skipped_files == 0
 
+    @pytest.mark.skipif(not _HAS_PYZIPPER, reason="pyzipper not installed")
     def test_backup_creator_with_password(
         self,
         test_structure: Path,
         backup_path: Path
     ) -> None:
         """Test: creating backup with password."""
-        try:
-            import pyzipper  # type: ignore[import-untyped]
-        except ImportError:
-            pytest.skip("pyzipper not installed")
-
         password = b"test_password_123"
         creator = BackupCreator(
             source_dir=test_structure,
@@ -99,6 +104,184 @@ class TestBackupCreatorIntegration:
         assert creator.stats.total_files == 3
         assert creator.stats.processed_files == 3
 
+    def test_backup_creator_memory_mapped_file(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: file above MMAP_MIN_SIZE is archived from a mapping."""
+        test_dir = tmp_path / "mmap_test"
+        test_dir.mkdir()
+        content = b"mapped line\n" * 5000 + os.urandom(3000)
+        (test_dir / "large.bin").write_bytes(content)
+
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None,
+            chunk_size=4096
+        )
+
+        with patch('utils.backup_folder.MMAP_MIN_SIZE', 8192):
+            creator.create_archive()
+
+        assert creator.stats.processed_files == 1
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            assert archive.read("large.bin") == content
+
+    def test_backup_creator_file_truncated_after_scan(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: file emptied after the scan is streamed, not mapped."""
+        test_dir = tmp_path / "truncated_test"
+        test_dir.mkdir()
+        large_file = test_dir / "large.bin"
+        large_file.write_bytes(b"mapped line\n" * 5000)
+
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None,
+            chunk_size=4096
+        )
+        creator.calculate_total_size()
+        large_file.write_bytes(b"")
+
+        # Keep the stale scan result: the file changed after the scan
+        with patch.object(creator, 'calculate_total_size'), \
+                patch('utils.backup_folder.MMAP_MIN_SIZE', 8192):
+            creator.create_archive()
+
+        assert creator.stats.skipped_files == 0
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            assert archive.read("large.bin") == b""
+
+    def test_backup_creator_skips_file_on_value_error(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: ValueError while copying a file counts as skipped."""
+        test_dir = tmp_path / "value_error_test"
+        test_dir.mkdir()
+        (test_dir / "large.bin").write_bytes(b"mapped line\n" * 5000)
+        (test_dir / "small.txt").write_bytes(b"small")
+
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None,
+            chunk_size=4096
+        )
+
+        with patch(
+            'utils.backup_folder.FileProcessor.copy_file_mapped',
+            side_effect=ValueError("cannot mmap an empty file")
+        ), patch('utils.backup_folder.MMAP_MIN_SIZE', 8192):
+            creator.create_archive()
+
+        assert creator.stats.processed_files == 1
+        assert creator.stats.skipped_files == 1
+
+    def test_backup_creator_tar_zst(
+        self,
+        test_structure: Path,
+        tmp_path: Path
+    ) -> None:
+        """Test: creating zstd-compressed tar backup."""
+        try:
+            import zstandard  # type: ignore[import-not-found]
+        except ImportError:
+            pytest.skip("zstandard not installed")
+
+        backup_path = tmp_path / "backup.tar.zst"
+        creator = BackupCreator(
+            source_dir=test_structure,
+            backup_path=backup_path,
+            password=None,
+            archive_format='tar.zst'
+        )
+
+        creator.create_archive()
+
+        assert creator.stats.processed_files == 3
+        assert creator.stats.archive_size == backup_path.stat().st_size
+        with open(backup_path, 'rb') as raw:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+            with tarfile.open(fileobj=reader, mode='r|') as archive:
+                contents = {
+                    member.name: archive.extractfile(member).read()
+                    for member in archive
+                }
+        assert contents["file1.txt"] == b"Content of file 1"
+        assert contents["subdir/file3.txt"] == b"Content of file 3"
+
+    @pytest.mark.usefixtures("passthrough_zstandard")
+    def test_backup_creator_tar_unreadable_file(
+        self,
+        tmp_path: Path
+    ) -> None:
+        """Test: read error after the tar header keeps the stream valid."""
+        test_dir = tmp_path / "tar_test"
+        test_dir.mkdir()
+        files = {
+            f"file{i}.txt": f"Content of file {i}\n".encode() * 2000
+            for i in range(4)
+        }
+        for name, content in files.items():
+            (test_dir / name).write_bytes(content)
+
+        def open_source(file, mode='r', *args, **kwargs):
+            if str(file).endswith("file1.txt"):
+                return UnreadableFile(file, mode)
+            return open(file, mode, *args, **kwargs)
+
+        backup_path = tmp_path / "backup.tar.zst"
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None,
+            archive_format='tar.zst'
+        )
+
+        with patch('utils.backup_folder.open', open_source, create=True):
+            creator.create_archive()
+
+        assert creator.stats.skipped_files == 1
+        assert creator.stats.processed_files == 3
+        with tarfile.open(backup_path, 'r:') as archive:
+            contents = {
+                member.name: archive.extractfile(member).read()
+                for member in archive
+            }
+        # The broken member is zero-padded to its header size
+        assert contents.pop("file1.txt") == bytes(len(files.pop("file1.txt")))
+        assert contents == files
+
+    @pytest.mark.usefixtures("passthrough_zstandard")
+    def test_backup_creator_tar_write_error(
+        self,
+        test_structure: Path,
+        tmp_path: Path
+    ) -> None:
+        """Test: error inside addfile aborts instead of skipping a file."""
+        creator = BackupCreator(
+            source_dir=test_structure,
+            backup_path=tmp_path / "backup.tar.zst",
+            password=None,
+            archive_format='tar.zst'
+        )
+
+        with patch(
+            'tarfile.TarFile.addfile',
+            side_effect=OSError(errno.ENOSPC, "No space left on device")
+        ), pytest.raises(OSError, match="No space left"):
+            creator.create_archive()
+
+        assert creator.stats.skipped_files == 0
+
     def test_backup_creator_archive_content(
         self,
         test_structure: Path,
@@ -114,15 +297,16 @@ class TestBackupCreatorIntegration:
         creator.create_archive()
 
         with zipfile.ZipFile(backup_path, 'r') as archive:
-            file_list = archive.namelist()
+            contents = {
+                name: archive.read(name).decode('utf-8')
+                for name in archive.namelist()
+            }
 
-            assert "file1.txt" in file_list
-            assert "subdir/file2.txt" in file_list
-            assert "subdir/file3.txt" in file_list
-
-            assert archive.read("file1.txt").decode('utf-8') == "Content of file 1"
-            assert archive.read("subdir/file2.txt").decode('utf-8') == "Content of file 2"
-            assert archive.read("subdir/file3.txt").decode('utf-8') == "Content of file 3"
+        assert contents == {
+            "file1.txt": "Content of file 1",
+            "subdir/file2.txt": "Content of file 2",
+            "subdir/file3.txt": "Content of file 3",
+        }
 
     def test_backup_creator_progress_callback(
         self,
@@ -145,6 +329,144 @@ class TestBackupCreatorIntegration:
         creator.create_archive()
 
         assert creator.stats.processed_files == 3
+        # Throttled by wall-clock time, but first and final always fire
+        assert len(callback_calls) >= 2
+
+    def test_backup_creator_parallel_compression(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: archiving many files through the process pool."""
+        test_dir = tmp_path / "parallel_test"
+        test_dir.mkdir()
+
+        expected = {}
+        for i in range(12):
+            name = f"file{i}.txt"
+            content = f"Content of file {i}\n".encode('utf-8') * (i + 1)
+            (test_dir / name).write_bytes(content)
+            expected[name] = content
+
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None,
+            max_workers=2
+        )
+
+        creator.create_archive()
+
+        assert creator._use_process_pool()
+        assert creator.stats.processed_files == 12
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            assert archive.testzip() is None
+            for name, content in expected.items():
+                assert archive.read(name) == content
+
+    @pytest.mark.skipif(not _HAS_PYZIPPER, reason="pyzipper not installed")
+    def test_backup_creator_parallel_with_password(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: AE-2 entries encrypted in workers are readable."""
+        import pyzipper  # type: ignore[import-untyped]
+
+        test_dir = tmp_path / "secret_test"
+        test_dir.mkdir()
+
+        expected = {}
+        for i in range(8):
+            name = f"file{i}.txt"
+            content = f"Secret {i}\n".encode('utf-8') * (i * 20 + 1)
+            (test_dir / name).write_bytes(content)
+            expected[name] = content
+
+        password = b"test_password_123"
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=password,
+            max_workers=2
+        )
+
+        creator.create_archive()
+
+        assert creator._use_process_pool()
+        with pyzipper.AESZipFile(backup_path, 'r') as archive:
+            archive.setpassword(password)
+            assert archive.testzip() is None
+            for name, content in expected.items():
+                assert archive.getinfo(name).flag_bits & 0x01
+                assert archive.read(name) == content
+
+            archive.setpassword(b"wrong")
+            with pytest.raises(RuntimeError):
+                archive.read("file0.txt")
+
+    def test_backup_creator_parallel_with_local_large_files(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: large files compressed in-process alongside the pool."""
+        test_dir = tmp_path / "mixed_test"
+        test_dir.mkdir()
+
+        expected = {}
+        for i in range(10):
+            name = f"file{i}.txt"
+            content = f"Line {i}\n".encode('utf-8') * (i * 50 + 1)
+            (test_dir / name).write_bytes(content)
+            expected[name] = content
+
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None,
+            max_workers=2
+        )
+
+        with patch('utils.backup_folder.PARALLEL_FILE_SIZE_LIMIT', 1024):
+            creator.create_archive()
+
+        assert creator.stats.processed_files == 10
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            assert archive.testzip() is None
+            for name, content in expected.items():
+                assert archive.read(name) == content
+
+    def test_backup_creator_stores_incompressible_files(
+        self,
+        tmp_path: Path,
+        backup_path: Path
+    ) -> None:
+        """Test: already-compressed files are stored without DEFLATE."""
+        test_dir = tmp_path / "media_test"
+        test_dir.mkdir()
+
+        random_data = os.urandom(128 * 1024)
+        (test_dir / "photo.jpg").write_bytes(b"jpeg bytes" * 100)
+        (test_dir / "random.bin").write_bytes(random_data)
+        (test_dir / "notes.txt").write_text("notes " * 100)
+
+        creator = BackupCreator(
+            source_dir=test_dir,
+            backup_path=backup_path,
+            password=None
+        )
+
+        creator.create_archive()
+
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            stored = archive.getinfo("photo.jpg").compress_type
+            assert stored == zipfile.ZIP_STORED
+            random_type = archive.getinfo("random.bin").compress_type
+            assert random_type == zipfile.ZIP_STORED
+            text_type = archive.getinfo("notes.txt").compress_type
+            assert text_type == zipfile.ZIP_DEFLATED
+            assert archive.read("random.bin") == random_data
 
     def test_backup_creator_validation_source_not_exists(
         self,
@@ -182,9 +504,14 @@ class TestBackupCreatorIntegration:
     def test_backup_creator_compression_ratio(
         self,
         test_structure: Path,
-        backup_path: Path
+        backup_path: Path,
+        monkeypatch
     ) -> None:
-        """Test: compression ratio calculation."""
+        """Test: compression ratio calculation on a stored archive."""
+        monkeypatch.setattr(
+            'utils.backup_folder.choose_compress_type',
+            lambda file_path, sample: zipfile.ZIP_STORED
+        )
         creator = BackupCreator(
             source_dir=test_structure,
             backup_path=backup_path,
@@ -193,13 +520,17 @@ class TestBackupCreatorIntegration:
 
         creator.create_archive()
 
-        # Compression ratio can be negative for very small files due to ZIP overhead
-        # For very small files, overhead can be much larger than original size
-        # So we allow a wider range (from -500% to 100%)
-        assert creator.stats.compression_ratio >= -500.0
-        assert creator.stats.compression_ratio <= 100.0
-        # Compression ratio should be a valid number
-        assert isinstance(creator.stats.compression_ratio, (int, float))
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            assert all(
+                info.compress_type == zipfile.ZIP_STORED
+                for info in archive.infolist()
+            )
+        stats = creator.stats
+        # Stored entries plus ZIP headers are larger than the tiny files
+        assert stats.archive_size > stats.total_size
+        assert stats.compression_ratio == pytest.approx(
+            (1 - stats.archive_size / stats.total_size) * 100.0
+        )
 
     def test_backup_creator_large_file_chunked_reading(
         self,
@@ -211,8 +542,12 @@ class TestBackupCreatorIntegration:
         test_dir.mkdir()
 
         large_file = test_dir / "large.bin"
-        large_content = b"X" * (10 * 1024 * 1024)  # 10 MB
-        large_file.write_bytes(large_content)
+        large_size = 10 * 1024 * 1024  # 10 MB
+        prefix = b"X" * (64 * 1024)
+        # Sparse tail: the file reports 10 MB without writing the zeros
+        with open(large_file, 'wb') as f:
+            f.write(prefix)
+            f.truncate(large_size)
 
         creator = BackupCreator(
             source_dir=test_dir,
@@ -225,19 +560,34 @@ class TestBackupCreatorIntegration:
         assert backup_path.exists()
         with zipfile.ZipFile(backup_path, 'r') as archive:
             assert "large.bin" in archive.namelist()
-            assert len(archive.read("large.bin")) == len(large_content)
+            data = archive.read("large.bin")
+            assert len(data) == large_size
+            assert data.startswith(prefix)
 
     def test_backup_creator_skipped_files(
         self,
         tmp_path: Path,
-        backup_path: Path
+        backup_path: Path,
+        monkeypatch
     ) -> None:
-        """Test: handling files without access."""
+        """Test: files that cannot be read are skipped and counted."""
         test_dir = tmp_path / "permission_test"
         test_dir.mkdir()
+        (test_dir / "normal.txt").write_bytes(b"normal content")
+        (test_dir / "locked.txt").write_bytes(b"locked content")
 
-        normal_file = test_dir / "normal.txt"
-        normal_file.write_text("normal content")
+        original_read = FileProcessor.read_file_direct
+
+        def read_file_direct(self, file_path):
+            if Path(file_path).name == "locked.txt":
+                raise PermissionError(f"Permission denied: {file_path}")
+            return original_read(self, file_path)
+
+        monkeypatch.setattr(
+            FileProcessor,
+            'read_file_direct',
+            read_file_direct
+        )
 
         creator = BackupCreator(
             source_dir=test_dir,
@@ -247,24 +597,42 @@ class TestBackupCreatorIntegration:
 
         creator.create_archive()
 
-        assert creator.stats.skipped_files == 0
+        assert creator.stats.skipped_files == 1
         assert creator.stats.processed_files == 1
+        with zipfile.ZipFile(backup_path, 'r') as archive:
+            assert archive.namelist() == ["normal.txt"]
 
 
 class TestFormatBackupNameIntegration:
     """Integration tests for format_backup_name."""
 
-    def test_format_backup_name_uniqueness(self) -> None:
-        """Test: backup name uniqueness."""
-        import time
-
-        name1 = format_backup_name("test_folder")
-        time.sleep(1)
-        name2 = format_backup_name("test_folder")
+    @pytest.mark.parametrize("earlier, later", [
+        (datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 12, 1)),
+        (datetime(2024, 1, 1, 23, 59), datetime(2024, 1, 2, 0, 0)),
+        (datetime(2024, 2, 28, 23, 59), datetime(2024, 2, 29, 0, 0)),
+        (datetime(2023, 12, 31, 23, 59), datetime(2024, 1, 1, 0, 0)),
+    ], ids=['minute', 'day', 'leap-day', 'year'])
+    def test_format_backup_name_uniqueness(
+        self,
+        earlier: datetime,
+        later: datetime
+    ) -> None:
+        """Test: names of adjacent minutes differ and keep their time."""
+        with patch('utils.backup_folder.datetime') as mock_datetime:
+            mock_datetime.now.side_effect = [earlier, later]
+            name1 = format_backup_name("test_folder")
+            name2 = format_backup_name("test_folder")
 
-        assert name1.startswith("test_folder_")
-        assert name2.startswith("test_folder_")
+        assert name1 != name2
         assert len(name1) == len(name2)
+        # DD-MM-YYYY names do not sort as strings; parse them back
+        prefix = "test_folder_"
+        assert datetime.strptime(
+            name1.removeprefix(prefix), '%d-%m-%Y_%H-%M'
+        ) == earlier
+        assert datetime.strptime(
+            name2.removeprefix(prefix), '%d-%m-%Y_%H-%M'
+        ) == later
 
 
 if __name__ == "__main__":
@@ -0,0 +1,1069 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for restore_folder.py.
+
+Tests extraction of archives:
+- Backup and restore round trips (serial and parallel, stored and
+  deflated entries, with and without password)
+- Restore options: skip verify, no CRC, direct I/O
+- CRC checks of stored entries
+- Copy buffer isolation between serial and parallel extraction
+- Restore from http(s) URL with range requests
+- libdeflate decompression and CRC (stub ``deflate`` module)
+- Free disk space check before extraction
+- Grouping of files into batches for parallel extraction
+- Password prompt with re-asking on wrong password
+- format_size unit boundaries
+- Disk space preallocation and its fallbacks
+- Files that cannot be written are skipped and listed
+- zipfile private attributes relied on by ArchiveOpener and open_entry
+"""
+
+import contextlib
+import errno
+import functools
+import http.server
+import importlib.util
+import io
+import os
+import re
+import sys
+import threading
+import types
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Iterator, Optional
+from unittest.mock import patch
+
+import pytest
+
+from utils.backup_folder import FAST_COMPRESSION_LEVEL, BackupCreator
+from utils.restore_folder import (
+    ArchiveOpener,
+    HttpRangeReader,
+    RestoreExtractor,
+    check_password,
+    format_size,
+    get_crc32,
+    get_entry_parent,
+    get_libdeflate,
+    get_password,
+    inflate_entry,
+    main,
+    open_entry,
+    preallocate,
+    print_restore_info,
+)
+
+_HAS_PYZIPPER = importlib.util.find_spec("pyzipper") is not None
+
+PASSWORD = b"restore_password_123"
+# Keyword arguments of RestoreExtractor for the CLI restore options
+RESTORE_OPTIONS = {
+    'default': {},
+    'skip-verify': {'verify': False},
+    'no-crc': {'check_crc': False},
+    'skip-verify-no-crc': {'verify': False, 'check_crc': False},
+    'direct-io': {'direct_io': True},
+}
+
+
+def read_tree(root: Path) -> dict[str, bytes]:
+    """Read all files below root keyed by relative POSIX path."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*") if path.is_file()
+    }
+
+
+class QuietRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler without request logging; ignores Range."""
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class RangeRequestHandler(QuietRequestHandler):
+    """Static file handler answering ``bytes=a-b`` ranges with 206."""
+
+    def do_GET(self) -> None:
+        match = re.fullmatch(
+            r'bytes=(\d+)-(\d+)',
+            self.headers.get('Range', '')
+        )
+        if match is None:
+            super().do_GET()
+            return
+
+        path = self.translate_path(self.path)
+        size = os.path.getsize(path)
+        start = int(match[1])
+        end = min(int(match[2]), size - 1)
+        with open(path, 'rb') as source:
+            source.seek(start)
+            data = source.read(end - start + 1)
+
+        self.send_response(206)
+        self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@contextlib.contextmanager
+def serve_directory(
+    directory: Path,
+    handler: type[http.server.SimpleHTTPRequestHandler]
+) -> Iterator[str]:
+    """Serve directory over HTTP on a free local port.
+
+    Yields:
+        Base URL of the server, without trailing slash.
+    """
+    server = http.server.ThreadingHTTPServer(
+        ('127.0.0.1', 0),
+        functools.partial(handler, directory=str(directory))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.fixture(scope="module")
+def source_files() -> dict[str, bytes]:
+    """Content of the round-trip source tree by relative path."""
+    return {
+        "notes.txt": b"notes line\n" * 200,
+        "empty.txt": b"",
+        "photo.jpg": os.urandom(20000),  # stored by suffix
+        "docs/readme.md": "Привет, архив\n".encode('utf-8') * 50,
+        "docs/deep/data.csv": b"a,b,c\n1,2,3\n" * 300,
+        "docs/deep/файл.txt": "юникод\n".encode('utf-8') * 10,
+        # Larger than CHUNK_SIZE: streamed instead of one read
+        "big/large.bin": os.urandom(4096) * 384,
+        "big/large.zip": os.urandom(1536 * 1024),  # stored by suffix
+    }
+
+
+@pytest.fixture(scope="module", params=[
+    None,
+    pytest.param(PASSWORD, marks=pytest.mark.skipif(
+        not _HAS_PYZIPPER, reason="pyzipper not installed"
+    )),
+], ids=['plain', 'password'])
+def backup_archive(
+    request: pytest.FixtureRequest,
+    source_files: dict[str, bytes],
+    tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, Optional[bytes]]:
+    """Archive of source_files made by BackupCreator, once per module.
+
+    Returns:
+        Tuple of (archive path, password or None).
+    """
+    password = request.param
+    source_dir = tmp_path_factory.mktemp("restore_source")
+    for name, content in source_files.items():
+        file_path = source_dir / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
+    archive_path = tmp_path_factory.mktemp("restore_backup") / "backup.zip"
+    creator = BackupCreator(
+        source_dir,
+        archive_path,
+        password,
+        None,
+        compress_level=FAST_COMPRESSION_LEVEL
+    )
+    creator.create_archive()
+    return archive_path, password
+
+
+@pytest.fixture
+def corrupted_stored_archive(tmp_path: Path) -> Path:
+    """Stored archive of six files, data of file0.txt corrupted."""
+    archive_path = tmp_path / "stored.zip"
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED) as archive:
+        for i in range(6):
+            archive.writestr(f"file{i}.txt", b"stored content %d\n" % i * 50)
+
+    data = bytearray(archive_path.read_bytes())
+    data[data.index(b"stored content 0")] ^= 0xFF
+    archive_path.write_bytes(data)
+    return archive_path
+
+
+@pytest.fixture
+def large_files_archive(tmp_path: Path) -> tuple[Path, dict[str, bytes]]:
+    """Deflated archive of files larger than the copy buffer."""
+    archive_path = tmp_path / "large.zip"
+    # Distinct per file, repeats keep compression cheap
+    files = {
+        f"data/file{i}.bin": os.urandom(4096) * 384  # 1.5 MB
+        for i in range(8)
+    }
+    with zipfile.ZipFile(
+        archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return archive_path, files
+
+
+class TestRestoreRoundTrip:
+    """Backup and restore round trips comparing file content."""
+
+    def test_backup_archive_entry_types(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]]
+    ) -> None:
+        """Test: round-trip archive has both stored and deflated entries."""
+        archive_path, password = backup_archive
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            infos = archive.infolist()
+
+        if password is None:
+            compress_types = {info.compress_type for info in infos}
+            assert compress_types == {zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED}
+        else:
+            assert all(info.flag_bits & 0x01 for info in infos)
+
+    @pytest.mark.parametrize("max_workers", [1, 2], ids=['serial', 'parallel'])
+    @pytest.mark.parametrize("options", list(RESTORE_OPTIONS))
+    def test_restore_round_trip(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        options: str,
+        max_workers: int
+    ) -> None:
+        """Test: restored tree equals the backed up one."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        extractor = RestoreExtractor(
+            archive_path,
+            target_dir,
+            password=password,
+            max_workers=max_workers,
+            **RESTORE_OPTIONS[options]
+        )
+
+        extractor.extract_archive()
+
+        assert read_tree(target_dir) == source_files
+        assert extractor.stats.extracted_files == len(source_files)
+        assert extractor.stats.failed_files == []
+
+    def test_restore_wrong_password(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        tmp_path: Path
+    ) -> None:
+        """Test: wrong password fails instead of writing garbage."""
+        archive_path, password = backup_archive
+        if password is None:
+            pytest.skip("archive is not encrypted")
+
+        extractor = RestoreExtractor(
+            archive_path,
+            tmp_path / "restored",
+            password=b"wrong",
+            max_workers=1
+        )
+
+        with pytest.raises(RuntimeError):
+            extractor.extract_archive()
+
+    def test_main_restore_options(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        monkeypatch
+    ) -> None:
+        """Test: command line options restore the same tree."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        argv = [
+            "restore_folder.py",
+            str(archive_path),
+            "--output", str(target_dir),
+            "--workers", "2",
+            "--skip-verify",
+            "--no-crc",
+            "--direct-io",
+        ]
+        if password is not None:
+            argv += ["--password", password.decode('utf-8')]
+        monkeypatch.setattr(sys, 'argv', argv)
+
+        assert main() == 0
+        assert read_tree(target_dir) == source_files
+
+
+class TestHttpRangeReader:
+    """Tests for reading and restoring archives over HTTP."""
+
+    @pytest.fixture
+    def remote_file(self, tmp_path: Path) -> Iterator[tuple[str, bytes]]:
+        """URL and content of a file served with range support."""
+        content = bytes(range(256)) * 40
+        (tmp_path / "data.bin").write_bytes(content)
+        with serve_directory(tmp_path, RangeRequestHandler) as base_url:
+            yield f"{base_url}/data.bin", content
+
+    def test_read_middle_of_file(
+        self,
+        remote_file: tuple[str, bytes]
+    ) -> None:
+        """Test: seek and read inside the file fetch that range."""
+        url, content = remote_file
+        with HttpRangeReader(url) as reader:
+            assert reader.size == len(content)
+            assert reader.seek(1000) == 1000
+            assert reader.read(300) == content[1000:1300]
+            assert reader.tell() == 1300
+            assert reader.pread(10, 5000) == content[5000:5010]
+            assert reader.tell() == 1300
+
+    def test_read_at_end_of_file(
+        self,
+        remote_file: tuple[str, bytes]
+    ) -> None:
+        """Test: reads are cut at end of file and return empty at EOF."""
+        url, content = remote_file
+        with HttpRangeReader(url) as reader:
+            reader.seek(-10, io.SEEK_END)
+            assert reader.read(100) == content[-10:]
+            assert reader.read(100) == b''
+            assert reader.pread(10, len(content)) == b''
+
+    def test_server_without_range_support(self, tmp_path: Path) -> None:
+        """Test: server answering 200 to a range request is rejected."""
+        (tmp_path / "data.bin").write_bytes(b"x" * 100)
+        with serve_directory(tmp_path, QuietRequestHandler) as base_url:
+            with pytest.raises(OSError, match="range requests"):
+                HttpRangeReader(f"{base_url}/data.bin")
+
+    @pytest.mark.parametrize("max_workers", [1, 2], ids=['serial', 'parallel'])
+    def test_restore_from_url(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        max_workers: int
+    ) -> None:
+        """Test: archive restored from URL equals the backed up tree."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        with serve_directory(
+            archive_path.parent,
+            RangeRequestHandler
+        ) as base_url:
+            extractor = RestoreExtractor(
+                f"{base_url}/{archive_path.name}",
+                target_dir,
+                password=password,
+                max_workers=max_workers
+            )
+            extractor.extract_archive()
+
+        assert read_tree(target_dir) == source_files
+        assert extractor.stats.failed_files == []
+
+    def test_main_restore_from_url(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        monkeypatch
+    ) -> None:
+        """Test: command line accepts an archive URL."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        with serve_directory(
+            archive_path.parent,
+            RangeRequestHandler
+        ) as base_url:
+            argv = [
+                "restore_folder.py",
+                f"{base_url}/{archive_path.name}",
+                "--output", str(target_dir),
+            ]
+            if password is not None:
+                argv += ["--password", password.decode('utf-8')]
+            monkeypatch.setattr(sys, 'argv', argv)
+
+            assert main() == 0
+
+        assert read_tree(target_dir) == source_files
+
+
+def make_deflate_stub() -> types.ModuleType:
+    """Build stand-in for the libdeflate ``deflate`` module over zlib.
+
+    Functions follow the signatures of the real bindings and record
+    their calls in the module's ``calls`` list.
+    """
+    module = types.ModuleType("deflate")
+    module.calls = []
+
+    class DeflateError(Exception):
+        pass
+
+    def deflate_decompress(data: bytes, originalsize: int) -> bytes:
+        module.calls.append('deflate_decompress')
+        try:
+            result = zlib.decompress(data, -15)
+        except zlib.error as e:
+            raise DeflateError(str(e)) from e
+        if len(result) != originalsize:
+            raise DeflateError("size mismatch")
+        return result
+
+    def crc32(data: bytes, value: int = 0) -> int:
+        module.calls.append('crc32')
+        return zlib.crc32(data, value)
+
+    module.DeflateError = DeflateError
+    module.deflate_decompress = deflate_decompress
+    module.crc32 = crc32
+    return module
+
+
+@pytest.fixture
+def deflate_stub(monkeypatch) -> Iterator[types.ModuleType]:
+    """Install stub ``deflate`` module, hide isal, reset probe caches."""
+    stub = make_deflate_stub()
+    monkeypatch.setitem(sys.modules, "deflate", stub)
+    monkeypatch.setitem(sys.modules, "isal", None)
+    get_libdeflate.cache_clear()
+    get_crc32.cache_clear()
+    yield stub
+    get_libdeflate.cache_clear()
+    get_crc32.cache_clear()
+
+
+class TestLibdeflate:
+    """Tests for libdeflate decompression and CRC."""
+
+    def test_get_libdeflate_and_crc32(
+        self,
+        deflate_stub: types.ModuleType
+    ) -> None:
+        """Test: installed bindings are picked up for inflate and CRC."""
+        assert get_libdeflate() is deflate_stub
+        assert get_crc32() is deflate_stub.crc32
+
+    def test_crc32_chaining_matches_zlib(
+        self,
+        deflate_stub: types.ModuleType
+    ) -> None:
+        """Test: CRC chained over chunks equals zlib CRC of all data."""
+        data = os.urandom(10000)
+        crc32 = get_crc32()
+
+        crc = 0
+        for offset in range(0, len(data), 3000):
+            crc = crc32(data[offset:offset + 3000], crc)
+
+        assert crc == zlib.crc32(data)
+
+    def test_inflate_entry(
+        self,
+        deflate_stub: types.ModuleType,
+        tmp_path: Path
+    ) -> None:
+        """Test: entry inflated in one call equals zipfile output."""
+        archive_path = tmp_path / "deflated.zip"
+        content = b"inflate me\n" * 1000
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("data.txt", content)
+
+        target = io.BytesIO()
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            file_info = archive.getinfo("data.txt")
+            assert inflate_entry(archive, file_info, target)
+
+        assert target.getvalue() == content
+        assert deflate_stub.calls == ['deflate_decompress', 'crc32']
+
+    def test_inflate_entry_bad_crc(
+        self,
+        deflate_stub: types.ModuleType,
+        tmp_path: Path
+    ) -> None:
+        """Test: CRC mismatch raises before anything is written."""
+        archive_path = tmp_path / "deflated.zip"
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("data.txt", b"inflate me\n" * 1000)
+
+        target = io.BytesIO()
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            file_info = archive.getinfo("data.txt")
+            file_info.CRC ^= 1
+            with pytest.raises(zipfile.BadZipFile, match="CRC"):
+                inflate_entry(archive, file_info, target)
+
+        assert target.getvalue() == b''
+
+    @pytest.mark.parametrize("max_workers", [1, 2], ids=['serial', 'parallel'])
+    def test_restore_round_trip(
+        self,
+        deflate_stub: types.ModuleType,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        max_workers: int
+    ) -> None:
+        """Test: restore through libdeflate equals the backed up tree."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        extractor = RestoreExtractor(
+            archive_path,
+            target_dir,
+            password=password,
+            max_workers=max_workers
+        )
+
+        extractor.extract_archive()
+
+        assert read_tree(target_dir) == source_files
+        if password is None and max_workers == 1:
+            assert 'deflate_decompress' in deflate_stub.calls
+
+
+class TestDiskSpace:
+    """Tests for the free disk space check."""
+
+    def test_not_enough_disk_space(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path
+    ) -> None:
+        """Test: extraction is refused before any file is written."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restore" / "target"
+        extractor = RestoreExtractor(
+            archive_path,
+            target_dir,
+            password=password,
+            max_workers=1
+        )
+
+        with patch(
+            'utils.restore_folder.shutil.disk_usage',
+            return_value=types.SimpleNamespace(free=1024)
+        ) as disk_usage, pytest.raises(OSError, match="Not enough disk"):
+            extractor.extract_archive()
+
+        # Free space is taken from the nearest existing directory
+        disk_usage.assert_called_once_with(tmp_path)
+        assert extractor.stats.total_size == sum(
+            len(content) for content in source_files.values()
+        )
+        assert extractor.stats.extracted_files == 0
+        assert not (tmp_path / "restore").exists()
+
+
+class TestMakeBatches:
+    """Tests for RestoreExtractor._make_batches."""
+
+    def test_make_batches(self, tmp_path: Path) -> None:
+        """Test: batch size, per-directory grouping, every file once."""
+        names = ["top.txt"]
+        names += [f"small/f{i}.txt" for i in range(3)]
+        names += [f"large/f{i:02}.txt" for i in range(20)]
+        names += [f"pair/f{i}.txt" for i in range(2)]
+        names.reverse()  # infolist() order differs from batch order
+        file_indexes = sorted(
+            range(len(names)),
+            key=lambda index: (get_entry_parent(names[index]), names[index])
+        )
+        extractor = RestoreExtractor(
+            tmp_path / "backup.zip",
+            tmp_path / "restored",
+            max_workers=2
+        )
+
+        batches = extractor._make_batches(file_indexes, names)
+
+        # 26 files over 2 workers * 4 batches: at most 4 files per batch
+        assert [[names[index] for index in batch] for batch in batches] == [
+            ["top.txt"],
+            ["large/f00.txt", "large/f01.txt", "large/f02.txt",
+             "large/f03.txt"],
+            ["large/f04.txt", "large/f05.txt", "large/f06.txt",
+             "large/f07.txt"],
+            ["large/f08.txt", "large/f09.txt", "large/f10.txt",
+             "large/f11.txt"],
+            ["large/f12.txt", "large/f13.txt", "large/f14.txt",
+             "large/f15.txt"],
+            ["large/f16.txt", "large/f17.txt", "large/f18.txt",
+             "large/f19.txt"],
+            ["pair/f0.txt", "pair/f1.txt"],
+            ["small/f0.txt", "small/f1.txt", "small/f2.txt"],
+        ]
+        assert [index for batch in batches for index in batch] == file_indexes
+
+    def test_make_batches_single_file(self, tmp_path: Path) -> None:
+        """Test: one file gives one batch."""
+        extractor = RestoreExtractor(
+            tmp_path / "backup.zip",
+            tmp_path / "restored",
+            max_workers=8
+        )
+
+        assert extractor._make_batches([0], ["only.txt"]) == [[0]]
+
+
+class TestGetPassword:
+    """Tests for the interactive password prompt."""
+
+    @pytest.fixture
+    def encrypted_archive(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]]
+    ) -> Iterator[zipfile.ZipFile]:
+        """Opened password-protected round-trip archive."""
+        archive_path, password = backup_archive
+        if password is None:
+            pytest.skip("archive is not encrypted")
+
+        with ArchiveOpener(archive_path).open_archive() as archive:
+            yield archive
+
+    def test_check_password(self, encrypted_archive: zipfile.ZipFile) -> None:
+        """Test: only the archive password passes the check."""
+        assert not check_password(encrypted_archive, b"wrong")
+        assert check_password(encrypted_archive, PASSWORD)
+
+    @patch('utils.restore_folder.getpass.getpass')
+    def test_wrong_password_asked_again(
+        self,
+        mock_getpass,
+        encrypted_archive: zipfile.ZipFile
+    ) -> None:
+        """Test: wrong password is rejected and the prompt repeated."""
+        mock_getpass.side_effect = ["wrong", PASSWORD.decode('utf-8')]
+
+        password = get_password(
+            check=functools.partial(check_password, encrypted_archive)
+        )
+
+        assert password == PASSWORD
+        assert mock_getpass.call_count == 2
+
+    @patch('utils.restore_folder.getpass.getpass')
+    def test_max_attempts_exceeded(
+        self,
+        mock_getpass,
+        encrypted_archive: zipfile.ZipFile
+    ) -> None:
+        """Test: prompt gives up after max_attempts wrong passwords."""
+        mock_getpass.side_effect = ["wrong1", "", "wrong2"]
+
+        with pytest.raises(ValueError, match="attempts"):
+            get_password(
+                max_attempts=3,
+                check=functools.partial(check_password, encrypted_archive)
+            )
+
+        assert mock_getpass.call_count == 3
+
+    @patch('utils.restore_folder.getpass.getpass')
+    def test_main_prompts_until_correct(
+        self,
+        mock_getpass,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        monkeypatch
+    ) -> None:
+        """Test: CLI without --password restores after a retry."""
+        archive_path, password = backup_archive
+        if password is None:
+            pytest.skip("archive is not encrypted")
+        mock_getpass.side_effect = ["wrong", password.decode('utf-8')]
+        target_dir = tmp_path / "restored"
+        monkeypatch.setattr(sys, 'argv', [
+            "restore_folder.py",
+            str(archive_path),
+            "--output", str(target_dir),
+        ])
+
+        assert main() == 0
+        assert mock_getpass.call_count == 2
+        assert read_tree(target_dir) == source_files
+
+
+class TestFormatSize:
+    """Tests for format_size function."""
+
+    @pytest.mark.parametrize("size_bytes, expected", [
+        (0, "0.0 B"),
+        (1, "1.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024 ** 2 - 1, "1024.0 KB"),
+        (1024 ** 2, "1.0 MB"),
+        (1024 ** 3, "1.0 GB"),
+        (1024 ** 4, "1.0 TB"),
+        (1024 ** 5, "1.0 PB"),
+        (3 * 1024 ** 6, "3072.0 PB"),  # largest unit is kept
+    ])
+    def test_format_size(self, size_bytes: int, expected: str) -> None:
+        """Test: formatting size with matching unit."""
+        assert format_size(size_bytes) == expected
+
+
+class TestPreallocate:
+    """Tests for preallocation of extracted files."""
+
+    @pytest.fixture
+    def preallocated_archive(
+        self,
+        tmp_path: Path
+    ) -> tuple[Path, dict[str, bytes]]:
+        """Archive of files above PREALLOCATE_MIN_SIZE, one unaligned."""
+        archive_path = tmp_path / "prealloc.zip"
+        files = {
+            "aligned.bin": os.urandom(4096) * 384,  # 1.5 MB
+            "unaligned.bin": os.urandom(4096) * 256 + b"tail" * 200,
+        }
+        with zipfile.ZipFile(
+            archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as archive:
+            for name, content in files.items():
+                archive.writestr(name, content)
+        return archive_path, files
+
+    @patch('utils.restore_folder.os.posix_fallocate', create=True)
+    def test_preallocate_unavailable(
+        self,
+        mock_fallocate,
+        tmp_path: Path
+    ) -> None:
+        """Test: nothing is done without posix_fallocate."""
+        with open(tmp_path / "file.bin", 'wb') as target, \
+                patch('utils.restore_folder.PREALLOCATE_AVAILABLE', False):
+            preallocate(target.fileno(), 8 * 1024 * 1024)
+
+        mock_fallocate.assert_not_called()
+
+    @patch('utils.restore_folder.os.posix_fallocate', create=True)
+    def test_preallocate_small_file(
+        self,
+        mock_fallocate,
+        tmp_path: Path
+    ) -> None:
+        """Test: files below PREALLOCATE_MIN_SIZE are not preallocated."""
+        with open(tmp_path / "file.bin", 'wb') as target, \
+                patch('utils.restore_folder.PREALLOCATE_AVAILABLE', True):
+            preallocate(target.fileno(), 4096)
+
+        mock_fallocate.assert_not_called()
+
+    @pytest.mark.parametrize("error_code, raised", [
+        (errno.EOPNOTSUPP, False),
+        (errno.EINVAL, False),
+        (errno.ENOSPC, True),
+    ], ids=['EOPNOTSUPP', 'EINVAL', 'ENOSPC'])
+    def test_preallocate_errors(
+        self,
+        tmp_path: Path,
+        error_code: int,
+        raised: bool
+    ) -> None:
+        """Test: only a full disk is an error, not missing support."""
+        error = OSError(error_code, os.strerror(error_code))
+        with open(tmp_path / "file.bin", 'wb') as target, \
+                patch('utils.restore_folder.PREALLOCATE_AVAILABLE', True), \
+                patch(
+                    'utils.restore_folder.os.posix_fallocate',
+                    side_effect=error,
+                    create=True
+                ):
+            if raised:
+                with pytest.raises(OSError) as exc_info:
+                    preallocate(target.fileno(), 8 * 1024 * 1024)
+                assert exc_info.value.errno == error_code
+            else:
+                preallocate(target.fileno(), 8 * 1024 * 1024)
+
+    @pytest.mark.parametrize("direct_io", [False, True])
+    @pytest.mark.parametrize("error_code", [
+        None,
+        errno.EOPNOTSUPP,
+        errno.EINVAL,
+    ], ids=['supported', 'EOPNOTSUPP', 'EINVAL'])
+    def test_extracted_file_size(
+        self,
+        preallocated_archive: tuple[Path, dict[str, bytes]],
+        tmp_path: Path,
+        error_code: Optional[int],
+        direct_io: bool
+    ) -> None:
+        """Test: extraction continues and files get their exact size."""
+        archive_path, files = preallocated_archive
+        target_dir = tmp_path / "restored"
+        extractor = RestoreExtractor(
+            archive_path,
+            target_dir,
+            max_workers=1,
+            direct_io=direct_io
+        )
+
+        with contextlib.ExitStack() as stack:
+            if error_code is not None:
+                stack.enter_context(patch(
+                    'utils.restore_folder.PREALLOCATE_AVAILABLE',
+                    True
+                ))
+                fallocate = stack.enter_context(patch(
+                    'utils.restore_folder.os.posix_fallocate',
+                    side_effect=OSError(error_code, os.strerror(error_code)),
+                    create=True
+                ))
+            extractor.extract_archive()
+
+        if error_code is not None:
+            assert fallocate.call_count == len(files)
+
+        for name, content in files.items():
+            assert (target_dir / name).stat().st_size == len(content)
+        assert read_tree(target_dir) == files
+
+
+class TestFailedFiles:
+    """Tests for files that cannot be written to the target."""
+
+    BLOCKED = ["docs/deep/data.csv", "docs/deep/файл.txt"]
+
+    def check_failed_restore(
+        self,
+        extractor: RestoreExtractor,
+        source_files: dict[str, bytes],
+        capsys
+    ) -> None:
+        """Check that only BLOCKED files failed and are reported."""
+        target_dir = extractor.target_dir
+        failed = sorted(name for name, _ in extractor.stats.failed_files)
+        assert failed == sorted(self.BLOCKED)
+        assert extractor.stats.skipped_files == len(self.BLOCKED)
+        assert extractor.stats.extracted_files == (
+            len(source_files) - len(self.BLOCKED)
+        )
+        for name, content in source_files.items():
+            if name not in self.BLOCKED:
+                assert (target_dir / name).read_bytes() == content
+
+        capsys.readouterr()
+        print_restore_info(extractor.stats, target_dir)
+        output = capsys.readouterr().out
+        for name in self.BLOCKED:
+            assert f"Warning: Skipped {name}: " in output
+        assert f"Skipped files: {len(self.BLOCKED)}" in output
+
+    @pytest.mark.skipif(
+        not hasattr(os, 'geteuid') or os.geteuid() == 0,
+        reason="root bypasses directory permissions"
+    )
+    @pytest.mark.parametrize("max_workers", [1, 2], ids=['serial', 'parallel'])
+    def test_read_only_subdirectory(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        max_workers: int,
+        capsys
+    ) -> None:
+        """Test: files of a read-only directory are skipped and listed."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        read_only_dir = target_dir / "docs" / "deep"
+        read_only_dir.mkdir(parents=True)
+        read_only_dir.chmod(0o555)
+        extractor = RestoreExtractor(
+            archive_path,
+            target_dir,
+            password=password,
+            max_workers=max_workers
+        )
+
+        try:
+            extractor.extract_archive()
+        finally:
+            read_only_dir.chmod(0o755)
+
+        self.check_failed_restore(extractor, source_files, capsys)
+
+    @pytest.mark.parametrize("max_workers", [1, 2], ids=['serial', 'parallel'])
+    def test_file_in_place_of_subdirectory(
+        self,
+        backup_archive: tuple[Path, Optional[bytes]],
+        source_files: dict[str, bytes],
+        tmp_path: Path,
+        max_workers: int,
+        capsys
+    ) -> None:
+        """Test: files below a path that is not a directory are skipped."""
+        archive_path, password = backup_archive
+        target_dir = tmp_path / "restored"
+        (target_dir / "docs").mkdir(parents=True)
+        (target_dir / "docs" / "deep").write_bytes(b"not a directory")
+        extractor = RestoreExtractor(
+            archive_path,
+            target_dir,
+            password=password,
+            max_workers=max_workers
+        )
+
+        extractor.extract_archive()
+
+        self.check_failed_restore(extractor, source_files, capsys)
+
+
+class TestZipfileInternals:
+    """Tests failing loudly if zipfile private attributes change."""
+
+    @pytest.mark.parametrize("zip_class_name", [
+        "zipfile.ZipFile",
+        pytest.param("pyzipper.AESZipFile", marks=pytest.mark.skipif(
+            not _HAS_PYZIPPER, reason="pyzipper not installed"
+        )),
+    ])
+    def test_buffered_archive_closes_file(
+        self,
+        corrupted_stored_archive: Path,
+        zip_class_name: str
+    ) -> None:
+        """Test: archive over a passed file closes it (_filePassed)."""
+        module_name, class_name = zip_class_name.split('.')
+        zip_class = getattr(importlib.import_module(module_name), class_name)
+        opener = ArchiveOpener(corrupted_stored_archive)
+
+        archive = opener._open_buffered(zip_class)
+        source = archive.fp
+        archive.close()
+
+        assert source.closed
+
+    def test_open_entry_without_crc_check(
+        self,
+        corrupted_stored_archive: Path
+    ) -> None:
+        """Test: check_crc=False turns off the CRC check (_expected_crc)."""
+        with zipfile.ZipFile(corrupted_stored_archive, 'r') as archive:
+            file_info = archive.getinfo("file0.txt")
+
+            with open_entry(archive, file_info, check_crc=False) as source:
+                assert len(source.read()) == file_info.file_size
+
+            with open_entry(archive, file_info) as source, \
+                    pytest.raises(zipfile.BadZipFile, match="CRC"):
+                source.read()
+
+
+class TestStoredEntryCrc:
+    """Tests for CRC checks of ZIP_STORED entries."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_corrupted_stored_entry_skip_verify(
+        self,
+        corrupted_stored_archive: Path,
+        tmp_path: Path,
+        max_workers: int
+    ) -> None:
+        """Test: without verify pass, extraction still checks CRC."""
+        extractor = RestoreExtractor(
+            corrupted_stored_archive,
+            tmp_path / "restored",
+            max_workers=max_workers,
+            verify=False
+        )
+
+        with pytest.raises(zipfile.BadZipFile, match="file0.txt"):
+            extractor.extract_archive()
+
+    def test_corrupted_stored_entry_verify(
+        self,
+        corrupted_stored_archive: Path,
+        tmp_path: Path
+    ) -> None:
+        """Test: verify pass rejects archive before extraction."""
+        extractor = RestoreExtractor(
+            corrupted_stored_archive,
+            tmp_path / "restored",
+            max_workers=1
+        )
+
+        with pytest.raises(zipfile.BadZipFile):
+            extractor.extract_archive()
+
+        assert not (tmp_path / "restored").exists()
+
+    def test_corrupted_stored_entry_no_crc(
+        self,
+        corrupted_stored_archive: Path,
+        tmp_path: Path
+    ) -> None:
+        """Test: with both checks off, data is copied as is."""
+        target_dir = tmp_path / "restored"
+        extractor = RestoreExtractor(
+            corrupted_stored_archive,
+            target_dir,
+            max_workers=1,
+            verify=False,
+            check_crc=False
+        )
+
+        extractor.extract_archive()
+
+        assert extractor.stats.extracted_files == 6
+        assert (target_dir / "file1.txt").read_bytes() == (
+            b"stored content 1\n" * 50
+        )
+        assert (target_dir / "file0.txt").read_bytes() != (
+            b"stored content 0\n" * 50
+        )
+
+
+class TestCopyBuffer:
+    """Tests for the per-thread copy buffer."""
+
+    @pytest.mark.parametrize("direct_io", [False, True])
+    def test_serial_then_parallel_restore(
+        self,
+        large_files_archive: tuple[Path, dict[str, bytes]],
+        tmp_path: Path,
+        direct_io: bool
+    ) -> None:
+        """Test: forked workers do not share the parent's copy buffer."""
+        archive_path, files = large_files_archive
+
+        for max_workers in (1, 4):
+            target_dir = tmp_path / f"restored_{max_workers}"
+            extractor = RestoreExtractor(
+                archive_path,
+                target_dir,
+                max_workers=max_workers,
+                direct_io=direct_io
+            )
+            extractor.extract_archive()
+
+            restored = {
+                name: (target_dir / name).read_bytes() for name in files
+            }
+            assert restored == files